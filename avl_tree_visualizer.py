@@ -21,6 +21,7 @@ Enhanced with:
 
 import customtkinter as ctk
 import tkinter as tk
+import tkinter.font as tkfont
 import math
 
 
@@ -36,6 +37,9 @@ class TreeNode(object):
         left (TreeNode): Reference to the left child node
         right (TreeNode): Reference to the right child node  
         height (int): Height of this node in the tree (leaf nodes have height 1)
+        x (float): Horizontal layout position, as a fraction of the drawing
+            width relative to the root (set by AVLTree.get_nodes_by_level)
+        y (int): Vertical layout position, i.e. the depth of the node
         
     Example:
         >>> node = TreeNode(10)
@@ -47,6 +51,8 @@ class TreeNode(object):
         True
     """
     
+    __slots__ = ('data', 'left', 'right', 'height', 'x', 'y')
+    
     def __init__(self, data):
         """
         Initialize a new tree node with the given data.
@@ -61,6 +67,8 @@ class TreeNode(object):
         self.left = None
         self.right = None
         self.height = 1
+        self.x = 0.0
+        self.y = 0
 
 
 class AVLTree(object):
@@ -80,16 +88,44 @@ class AVLTree(object):
     Example:
         >>> tree = AVLTree()
         >>> tree.insert(10)
+        []
         >>> tree.insert(5)
+        [(10, True)]
         >>> tree.search(10)
         True
         >>> tree.search(15)
         False
     """
     
+    # Upper bound on the number of detached nodes kept for reuse
+    _POOL_LIMIT = 4096
+    
+    # Horizontal distance from the root to its children, as a fraction of the
+    # drawing width, and how much that distance shrinks at each deeper level
+    LAYOUT_SPREAD = 1 / 6
+    LAYOUT_DECAY = 0.6
+
     def __init__(self):
         """Initialize an empty AVL tree."""
         self.root = None
+        self._size = 0  # Number of values in the tree
+        self._pool = []  # Detached nodes recycled by _new_node
+        self._dirty = True  # Set whenever the shape of the tree changes
+        self._cached_levels = None  # Result of the last get_nodes_by_level
+
+    def __len__(self):
+        """
+        Return the number of values in the tree.
+        
+        The count is kept up to date by every operation, so this is O(1).
+        
+        Example:
+            >>> tree = AVLTree()
+            >>> tree.bulk_insert([5, 10, 15])
+            >>> len(tree)
+            3
+        """
+        return self._size
 
     def search(self, data):
         """
@@ -107,32 +143,18 @@ class AVLTree(object):
         Example:
             >>> tree = AVLTree()
             >>> tree.insert(10)
+            []
             >>> tree.search(10)
             True
             >>> tree.search(5)
             False
         """
-        return self._search_recursive(self.root, data)
-    
-    def _search_recursive(self, root, data):
-        """
-        Recursively search for a value starting from the given root.
-        
-        Args:
-            root (TreeNode): The root of the subtree to search
-            data (int): The value to search for
-            
-        Returns:
-            bool: True if found, False otherwise
-        """
-        if not root:
-            return False
-        elif root.data == data:
-            return True
-        elif data < root.data:
-            return self._search_recursive(root.left, data)
-        else:
-            return self._search_recursive(root.right, data)
+        node = self.root
+        while node:
+            if data == node.data:
+                return True
+            node = node.left if data < node.data else node.right
+        return False
     
     def contains(self, data):
         """
@@ -156,62 +178,51 @@ class AVLTree(object):
         Args:
             data (int): The value to insert
             
+        Returns:
+            list: The descent to the insertion point as (value, went_left)
+                  pairs from the root downward, or None if the value was
+                  already in the tree
+            
         Time Complexity:
             O(log n) where n is the number of nodes in the tree
             
         Example:
             >>> tree = AVLTree()
             >>> tree.insert(10)
+            []
             >>> tree.insert(5)
-            >>> tree.contains(10)
+            [(10, True)]
+            >>> tree.insert(5) is None
             True
         """
-        self.root = self._insert_recursive(self.root, data)
-    
-    def _insert_recursive(self, root, data):
+        path, node = self._find_path(data)
+        if node is not None:
+            return None
+        steps = [(parent.data, went_left) for parent, went_left in path]
+        self._attach(path, data)
+        return steps
+
+    def _attach(self, path, data):
         """
-        Recursively insert a value and rebalance the tree.
+        Insert a new leaf at the end of a descent path and rebalance the tree.
         
         Args:
-            root (TreeNode): The root of the current subtree
+            path (list): (node, went_left) pairs leading to the empty position
             data (int): The value to insert
-            
-        Returns:
-            TreeNode: The new root of the subtree after insertion and balancing
         """
-        # Find the correct location and insert the node
-        if not root:
-            return TreeNode(data)
-        elif data < root.data:
-            root.left = self._insert_recursive(root.left, data)
-        else:
-            root.right = self._insert_recursive(root.right, data)
-
-        root.height = 1 + max(self._get_height(root.left),
-                              self._get_height(root.right))
-
-        # Update the balance factor and balance the tree
-        balance_factor = self._get_balance(root)
-        
-        # Left Left Case
-        if balance_factor > 1 and data < root.left.data:
-            return self._right_rotate(root)
-
-        # Right Right Case
-        if balance_factor < -1 and data > root.right.data:
-            return self._left_rotate(root)
-
-        # Left Right Case
-        if balance_factor > 1 and data > root.left.data:
-            root.left = self._left_rotate(root.left)
-            return self._right_rotate(root)
-
-        # Right Left Case
-        if balance_factor < -1 and data < root.right.data:
-            root.right = self._right_rotate(root.right)
-            return self._left_rotate(root)
-
-        return root
+        self._replace_child(path, self._new_node(data))
+        self._size += 1
+        self._dirty = True
+
+        # Walk back up the path, updating heights and rebalancing
+        while path:
+            node, _ = path.pop()
+            old_height = node.height
+            subroot = self._rebalance(node)
+            if subroot is node and node.height == old_height:
+                # Nothing above this node can have changed
+                break
+            self._replace_child(path, subroot)
 
     def delete(self, data):
         """
@@ -223,89 +234,341 @@ class AVLTree(object):
         Args:
             data (int): The value to delete
             
+        Returns:
+            tuple: (path, case, replacement), or None if the value was not
+                   in the tree. path lists the descent to the deleted node as
+                   (value, went_left) pairs; case is 1 for a leaf, 2 for a
+                   node with one child and 3 for a node with two children;
+                   replacement is the value that took the deleted node's
+                   place (its child or its inorder successor), None for a leaf
+            
         Time Complexity:
             O(log n) where n is the number of nodes in the tree
             
         Example:
             >>> tree = AVLTree()
-            >>> tree.insert(10)
+            >>> tree.bulk_insert([5, 10, 15])
             >>> tree.delete(10)
-            >>> tree.contains(10)
-            False
+            ([], 3, 15)
+            >>> tree.delete(10) is None
+            True
         """
-        self.root = self._delete_recursive(self.root, data)
-    
-    def _delete_recursive(self, root, data):
+        path, node = self._find_path(data)
+        if node is None:
+            return None
+        steps = [(parent.data, went_left) for parent, went_left in path]
+        case, replacement = self._remove(path, node)
+        return steps, case, replacement
+
+    def _remove(self, path, node):
         """
-        Recursively delete a value and rebalance the tree.
+        Unlink a node found at the end of a descent path and rebalance the tree.
         
         Args:
-            root (TreeNode): The root of the current subtree
-            data (int): The value to delete
+            path (list): (node, went_left) pairs leading to the node
+            node (TreeNode): The node holding the value to delete
             
         Returns:
-            TreeNode: The new root of the subtree after deletion and balancing
+            tuple: (case, replacement) as described in delete()
         """
-        # Find the node to be deleted and remove it
-        if not root:
-            return root
-        elif data < root.data:
-            root.left = self._delete_recursive(root.left, data)
-        elif data > root.data:
-            root.right = self._delete_recursive(root.right, data)
+        self._size -= 1
+        self._dirty = True
+
+        # Node with two children
+        if node.left is not None and node.right is not None:
+            # Get the inorder successor (smallest in the right subtree)
+            path.append((node, False))
+            successor = node.right
+            while successor.left is not None:
+                path.append((successor, True))
+                successor = successor.left
+                
+            # Copy the inorder successor's data to this node and
+            # unlink the successor instead
+            node.data = successor.data
+            node = successor
+            case, replacement = 3, successor.data
+            child = successor.right
         else:
             # Node with only one child or no child
-            if root.left is None:
-                temp = root.right
-                root = None
-                return temp
-            elif root.right is None:
-                temp = root.left
-                root = None
-                return temp
-                
-            # Node with two children
-            # Get the inorder successor (smallest in the right subtree)
-            temp = self._get_min_value_node(root.right)
-            
-            # Copy the inorder successor's data to this node
-            root.data = temp.data
+            child = node.left if node.left is not None else node.right
+            case = 1 if child is None else 2
+            replacement = None if child is None else child.data
             
-            # Delete the inorder successor
-            root.right = self._delete_recursive(root.right, temp.data)
+        self._replace_child(path, child)
+        self._release_node(node)
+
+        # Walk back up the path, updating heights and rebalancing
+        while path:
+            node, _ = path.pop()
+            old_height = node.height
+            subroot = self._rebalance(node)
+            if subroot is node and node.height == old_height:
+                # Nothing above this node can have changed
+                break
+            self._replace_child(path, subroot)
+        return case, replacement
+    
+    def _rebalance(self, root):
+        """
+        Update the height of a node on a retrace path and rebalance it.
         
-        # If the tree had only one node, return
-        if root is None:
-            return root
+        Args:
+            root (TreeNode): The node whose subtree gained or lost a value
+            
+        Returns:
+            TreeNode: The new root of the subtree after balancing
             
-        # Update the height of the current node
-        root.height = 1 + max(self._get_height(root.left),
-                              self._get_height(root.right))
+        Note:
+            The rotation is chosen from the sign of the node's balance factor
+            and the sign of its heavier child's balance factor. After an
+            insertion that child always leans towards the new value, so the
+            same test covers both insertion and deletion.
+        """
+        hl = 0 if root.left is None else root.left.height
+        hr = 0 if root.right is None else root.right.height
+        root.height = 1 + (hl if hl > hr else hr)
                               
         # Get the balance factor
-        balance_factor = self._get_balance(root)
+        balance_factor = hl - hr
         
         # Balance the tree
-        # Left Left Case
-        if balance_factor > 1 and self._get_balance(root.left) >= 0:
+        if balance_factor > 1:
+            child = root.left
+            child_balance = ((0 if child.left is None else child.left.height) -
+                             (0 if child.right is None else child.right.height))
+            # Left Left Case
+            if child_balance >= 0:
+                return self._right_rotate(root)
+            # Left Right Case
+            root.left = self._left_rotate(child)
             return self._right_rotate(root)
             
-        # Left Right Case
-        if balance_factor > 1 and self._get_balance(root.left) < 0:
-            root.left = self._left_rotate(root.left)
-            return self._right_rotate(root)
-            
-        # Right Right Case
-        if balance_factor < -1 and self._get_balance(root.right) <= 0:
-            return self._left_rotate(root)
-            
-        # Right Left Case
-        if balance_factor < -1 and self._get_balance(root.right) > 0:
-            root.right = self._right_rotate(root.right)
+        if balance_factor < -1:
+            child = root.right
+            child_balance = ((0 if child.left is None else child.left.height) -
+                             (0 if child.right is None else child.right.height))
+            # Right Right Case
+            if child_balance <= 0:
+                return self._left_rotate(root)
+            # Right Left Case
+            root.right = self._right_rotate(child)
             return self._left_rotate(root)
             
         return root
 
+    def insert_or_toggle(self, data):
+        """
+        Insert a value if it is missing, or delete it if it is already present.
+        
+        This does the work of contains() followed by insert() or delete() with
+        a single descent of the tree.
+        
+        Args:
+            data (int): The value to toggle
+            
+        Returns:
+            str: "inserted" or "deleted", depending on the action taken
+            
+        Example:
+            >>> tree = AVLTree()
+            >>> tree.insert_or_toggle(10)
+            'inserted'
+            >>> tree.insert_or_toggle(10)
+            'deleted'
+        """
+        return self.toggle(data)[0]
+
+    def toggle(self, data):
+        """
+        Insert a value if it is missing, or delete it if it is already present,
+        and report what was done.
+        
+        Args:
+            data (int): The value to toggle
+            
+        Returns:
+            tuple: (action, result) where action is "inserted" or "deleted"
+                   and result is what insert() or delete() would have returned
+            
+        Example:
+            >>> tree = AVLTree()
+            >>> tree.toggle(10)
+            ('inserted', [])
+            >>> tree.toggle(10)
+            ('deleted', ([], 1, None))
+        """
+        path, node = self._find_path(data)
+        steps = [(parent.data, went_left) for parent, went_left in path]
+        if node is None:
+            self._attach(path, data)
+            return "inserted", steps
+        case, replacement = self._remove(path, node)
+        return "deleted", (steps, case, replacement)
+
+    def build_sorted(self, keys):
+        """
+        Replace the contents of the tree with a perfectly balanced tree of keys.
+        
+        Args:
+            keys (list): The values to store, sorted and without duplicates
+            
+        Time Complexity:
+            O(n) where n is the number of keys; no rotations are needed
+            
+        Example:
+            >>> tree = AVLTree()
+            >>> tree.build_sorted([3, 5, 10, 12, 15])
+            >>> tree.root.data
+            10
+        """
+        for node in self._inorder_nodes():
+            self._release_node(node)
+        self.root = self._build_range(keys, 0, len(keys) - 1)
+        self._size = len(keys)
+        self._dirty = True
+
+    def _build_range(self, keys, lo, hi):
+        """
+        Recursively build a balanced subtree from a slice of sorted keys.
+        
+        Args:
+            keys (list): Sorted values without duplicates
+            lo (int): Index of the first key in the slice
+            hi (int): Index of the last key in the slice
+            
+        Returns:
+            TreeNode: The root of the subtree, or None for an empty slice
+        """
+        if lo > hi:
+            return None
+        mid = (lo + hi) // 2
+        node = self._new_node(keys[mid])
+        node.left = self._build_range(keys, lo, mid - 1)
+        node.right = self._build_range(keys, mid + 1, hi)
+        # Splitting at the midpoint makes the height depend only on the
+        # slice length, so no child heights need to be read
+        node.height = (hi - lo + 1).bit_length()
+        return node
+
+    def bulk_insert(self, values):
+        """
+        Insert many values at once by rebuilding the tree.
+        
+        Values that are already in the tree, or repeated in values, are
+        stored once. The result is a perfectly balanced tree.
+        
+        Args:
+            values (iterable): The values to insert, in any order
+            
+        Time Complexity:
+            O((n + k) log(n + k)) for n existing nodes and k new values,
+            dominated by sorting; the rebuild itself is linear
+            
+        Example:
+            >>> tree = AVLTree()
+            >>> tree.insert(10)
+            []
+            >>> tree.bulk_insert([15, 5, 10])
+            >>> [node.data for node in tree.get_nodes_by_level()[1]]
+            [5, 15]
+        """
+        keys = set(values)
+        keys.update(node.data for node in self._inorder_nodes())
+        self.build_sorted(sorted(keys))
+
+    def _inorder_nodes(self):
+        """
+        Collect the nodes of the tree in sorted order.
+        
+        Returns:
+            list: All nodes in the tree, ordered by value
+        """
+        nodes = []
+        stack = []
+        node = self.root
+        while stack or node:
+            while node:
+                stack.append(node)
+                node = node.left
+            node = stack.pop()
+            nodes.append(node)
+            node = node.right
+        return nodes
+
+    def _find_path(self, data):
+        """
+        Descend from the root towards a value, remembering the path taken.
+        
+        Args:
+            data (int): The value to look for
+            
+        Returns:
+            tuple: (path, node) where path is a list of (node, went_left) pairs
+                   from the root downward and node is the node holding data,
+                   or None if the value is not in the tree
+        """
+        path = []
+        node = self.root
+        while node and node.data != data:
+            went_left = data < node.data
+            path.append((node, went_left))
+            node = node.left if went_left else node.right
+        return path, node
+
+    def _replace_child(self, path, node):
+        """
+        Attach a node where the last step of a descent path pointed.
+        
+        Args:
+            path (list): (node, went_left) pairs from the root downward
+            node (TreeNode): The node to attach (can be None)
+            
+        Note:
+            With an empty path the node becomes the new root of the tree.
+        """
+        if not path:
+            self.root = node
+            return
+        parent, went_left = path[-1]
+        if went_left:
+            parent.left = node
+        else:
+            parent.right = node
+
+    def _new_node(self, data):
+        """
+        Create a leaf node, reusing a previously deleted node when possible.
+        
+        Args:
+            data (int): The value to store in the node
+            
+        Returns:
+            TreeNode: A leaf node holding data
+        """
+        if not self._pool:
+            return TreeNode(data)
+        node = self._pool.pop()
+        node.data = data
+        node.height = 1
+        return node
+
+    def _release_node(self, node):
+        """
+        Hand a node that was unlinked from the tree back to the pool.
+        
+        Args:
+            node (TreeNode): The detached node
+            
+        Note:
+            The node's children are cleared so the pool never keeps
+            parts of the tree alive.
+        """
+        if len(self._pool) < self._POOL_LIMIT:
+            node.left = None
+            node.right = None
+            self._pool.append(node)
+
     def _left_rotate(self, z):
         """
         Perform a left rotation to rebalance the tree.
@@ -329,11 +592,14 @@ class AVLTree(object):
         y.left = z
         z.right = T2
         
-        # Update heights
-        z.height = 1 + max(self._get_height(z.left),
-                           self._get_height(z.right))
-        y.height = 1 + max(self._get_height(y.left),
-                           self._get_height(y.right))
+        # Update heights (z first, since it is now y's left child)
+        zl = z.left
+        hl = 0 if zl is None else zl.height
+        hr = 0 if T2 is None else T2.height
+        z.height = hl = 1 + (hl if hl > hr else hr)
+        yr = y.right
+        hr = 0 if yr is None else yr.height
+        y.height = 1 + (hl if hl > hr else hr)
                            
         # Return the new root
         return y
@@ -361,11 +627,14 @@ class AVLTree(object):
         y.right = z
         z.left = T3
         
-        # Update heights
-        z.height = 1 + max(self._get_height(z.left),
-                           self._get_height(z.right))
-        y.height = 1 + max(self._get_height(y.left),
-                           self._get_height(y.right))
+        # Update heights (z first, since it is now y's right child)
+        zr = z.right
+        hl = 0 if T3 is None else T3.height
+        hr = 0 if zr is None else zr.height
+        z.height = hr = 1 + (hl if hl > hr else hr)
+        yl = y.left
+        hl = 0 if yl is None else yl.height
+        y.height = 1 + (hl if hl > hr else hr)
                            
         # Return the new root
         return y
@@ -383,6 +652,8 @@ class AVLTree(object):
         Note:
             Height is defined as the longest path from the node to a leaf.
             Leaf nodes have height 1, empty trees have height 0.
+            Insertion, deletion and rotations read node.height directly
+            instead of calling this method; it is kept for external callers.
         """
         if not root:
             return 0
@@ -401,6 +672,8 @@ class AVLTree(object):
         Note:
             A balance factor of -1, 0, or 1 indicates a balanced node.
             Values outside this range indicate the tree needs rebalancing.
+            Insertion and deletion compute balance factors inline instead of
+            calling this method; it is kept for external callers.
         """
         if not root:
             return 0
@@ -419,9 +692,11 @@ class AVLTree(object):
         Note:
             In a BST, the minimum value is always the leftmost node.
         """
-        if root is None or root.left is None:
+        if root is None:
             return root
-        return self._get_min_value_node(root.left)
+        while root.left is not None:
+            root = root.left
+        return root
 
     def get_nodes_by_level(self):
         """
@@ -438,35 +713,51 @@ class AVLTree(object):
             
         Note:
             This is useful for visualization and level-order traversal of the tree.
+            The result is cached until the next insert or delete, so callers
+            must treat it as read-only. Every node's x and y layout position is
+            up to date whenever this returns.
         """
-        if not self.root:
-            return []
-            
-        levels = []
-        self._collect_nodes_by_level(self.root, 0, levels)
-        return levels
+        if self._dirty:
+            self._relayout()
+        return self._cached_levels
     
-    def _collect_nodes_by_level(self, node, level, levels):
+    def _relayout(self):
         """
-        Recursively collect nodes at each level.
+        Rebuild the cached level lists and the layout position of every node.
         
-        Args:
-            node (TreeNode): Current node being processed
-            level (int): Current level in the tree (0 = root level)
-            levels (list): List of lists to store nodes by level
+        Both come from one breadth-first pass: each level is built from the
+        children of the one above, and each child is placed relative to its
+        parent. Node x positions are fractions of the drawing width measured
+        from the root, with the spread shrinking by LAYOUT_DECAY per level;
+        node y positions are the node's depth.
         """
-        if not node:
+        levels = []
+        self._cached_levels = levels
+        self._dirty = False
+        if not self.root:
             return
             
-        # Extend the levels list if necessary
-        while len(levels) <= level:
-            levels.append([])
-            
-        levels[level].append(node)
-        
-        # Recursively collect nodes from left and right subtrees
-        self._collect_nodes_by_level(node.left, level+1, levels)
-        self._collect_nodes_by_level(node.right, level+1, levels)
+        self.root.x = 0.0
+        self.root.y = 0
+        offset = self.LAYOUT_SPREAD
+        level = [self.root]
+        while level:
+            levels.append(level)
+            depth = len(levels)
+            next_level = []
+            for node in level:
+                if node.left:
+                    child = node.left
+                    child.x = node.x - offset
+                    child.y = depth
+                    next_level.append(child)
+                if node.right:
+                    child = node.right
+                    child.x = node.x + offset
+                    child.y = depth
+                    next_level.append(child)
+            level = next_level
+            offset *= self.LAYOUT_DECAY
     
     def print_tree(self):
         """
@@ -490,14 +781,22 @@ class AVLTree(object):
     
     def _print_helper(self, curr_ptr, indent, last):
         """
-        Recursive helper function for printing the tree structure.
+        Helper function for printing the tree structure.
+        
+        Nodes are printed in pre-order using an explicit stack, so deep trees
+        cannot hit Python's recursion limit.
         
         Args:
-            curr_ptr (TreeNode): Current node being printed
-            indent (str): Current indentation string for formatting
-            last (bool): True if this is the last child at its level
+            curr_ptr (TreeNode): Node at which to start printing
+            indent (str): Indentation string for that node
+            last (bool): True if that node is the last child at its level
         """
-        if curr_ptr:
+        stack = [(curr_ptr, indent, last)]
+        while stack:
+            curr_ptr, indent, last = stack.pop()
+            if not curr_ptr:
+                continue
+                
             print(indent, end="")
             if last:
                 print("R----", end="")
@@ -507,8 +806,50 @@ class AVLTree(object):
                 indent += "|    "
                 
             print(curr_ptr.data)
-            self._print_helper(curr_ptr.left, indent, False)
-            self._print_helper(curr_ptr.right, indent, True)
+            # Push the right child first so the left subtree is printed first
+            stack.append((curr_ptr.right, indent, True))
+            stack.append((curr_ptr.left, indent, False))
+
+
+# Static explanation text appended to the operation popups
+_INSERT_INFO = """
+
+🎯 Why This Placement?
+In a Binary Search Tree (BST), we follow a simple rule:
+• If new value < current node → go LEFT
+• If new value > current node → go RIGHT
+• Place the new node when we find an empty spot
+
+⚖️ AVL Balancing:
+After insertion, the tree checks each node's balance factor:
+• Balance Factor = Height(Left) - Height(Right)
+• If any node has |Balance Factor| > 1, rotations are performed
+• This keeps the tree height around log₂(n) for optimal performance
+
+🔄 Possible Rotations:
+• Left Rotation: When right side gets too heavy
+• Right Rotation: When left side gets too heavy
+• Left-Right: Complex case needing two rotations
+• Right-Left: Complex case needing two rotations
+"""
+
+_DELETE_INFO = """
+
+🗑️ Deletion Strategy:
+AVL deletion follows BST rules with three cases:
+1. Leaf node: Just remove it
+2. One child: Replace node with its child
+3. Two children: Replace with inorder successor
+
+🔄 Why Inorder Successor?
+The inorder successor is the smallest value in the right subtree.
+It's guaranteed to be larger than all left subtree values and smaller
+than all other right subtree values, maintaining BST property.
+
+⚖️ Rebalancing After Deletion:
+After removing a node, the tree might become unbalanced.
+The same rotation rules apply to restore the AVL property.
+"""
 
 
 class TreeVisualizer(ctk.CTk):
@@ -543,8 +884,17 @@ class TreeVisualizer(ctk.CTk):
         super().__init__()
         self.tree = AVLTree()
         self.operation_log = []  # Track operations for explanations
+        self.explanations_enabled = True  # Show the step-by-step popup
         self.zoom_scale = 1.0
-        self.current_explanation_window = None  # Track current popup window
+        self.zoom_origin = (0, 0)  # Canvas point the drawing scales around
+        self._drawn = {}  # node -> (oval_id, text_id, line_id, layout state)
+        self._redraw_pending = False  # A redraw is queued for the next idle moment
+        self._cw = self._ch = None  # Canvas size, kept up to date by <Configure>
+        self._expl_window = None  # Explanation popup, built once and then reused
+        
+        # Canvas fonts are created once and shared by every text item
+        self._node_font = tkfont.Font(family="Arial", size=12, weight="bold")
+        self._empty_font = tkfont.Font(family="Arial", size=16)
         self.title("AVL Tree Visualizer by Jose Mondragon")
         self.geometry("1100x900")
         
@@ -600,6 +950,17 @@ class TreeVisualizer(ctk.CTk):
             highlightthickness=0
         )
         self.canvas.pack(pady=(0, 10))
+        self.canvas.bind("<Configure>", self._on_canvas_resize)
+
+    def _on_canvas_resize(self, event):
+        """
+        Remember the new canvas size and redraw the tree to fit it.
+        
+        Args:
+            event: The <Configure> event carrying the canvas width and height
+        """
+        self._cw, self._ch = event.width, event.height
+        self._schedule_redraw()
 
     def _create_controls(self):
         """Create the control panel with input and buttons."""
@@ -659,6 +1020,14 @@ class TreeVisualizer(ctk.CTk):
         )
         self.print_button.pack(side="left", padx=5, pady=5)
 
+        self.explanations_switch = ctk.CTkSwitch(
+            extra_controls_frame,
+            text="Explanations",
+            command=self._toggle_explanations
+        )
+        self.explanations_switch.select()
+        self.explanations_switch.pack(side="left", padx=5, pady=5)
+
         self.exit_button = ctk.CTkButton(
             extra_controls_frame, 
             text="Exit", 
@@ -827,13 +1196,11 @@ For more advanced algorithms, see CSC6023 course materials.
         Resets the tree to an empty state and refreshes the visualization.
         """
         # Close any existing explanation window
-        if self.current_explanation_window and self.current_explanation_window.winfo_exists():
-            self.current_explanation_window.destroy()
-            self.current_explanation_window = None
+        self._hide_explanation()
             
         self.tree = AVLTree()
         self.operation_log = []  # Reset operation tracking
-        self.redraw_tree()
+        self._schedule_redraw()
         self._update_status("Tree cleared successfully", "success")
 
     def _print_to_console(self):
@@ -849,23 +1216,62 @@ For more advanced algorithms, see CSC6023 course materials.
         print("="*50 + "\n")
         self._update_status("Tree structure printed to console", "info")
 
+    def _toggle_explanations(self):
+        """
+        Turn the step-by-step explanation popup on or off.
+        
+        While explanations are off, operations skip building the explanation
+        entirely and only the status bar reports what happened.
+        """
+        self.explanations_enabled = bool(self.explanations_switch.get())
+        if self.explanations_enabled:
+            self._update_status("Explanations enabled", "info")
+            return
+            
+        # Close any existing explanation window
+        self._hide_explanation()
+        self._update_status("Explanations disabled", "info")
+
     def _zoom_in(self):
         """Zoom in the tree visualization."""
+        old_scale = self.zoom_scale
         self.zoom_scale = min(2.0, self.zoom_scale * 1.2)
         self.zoom_label.configure(text=f"{int(self.zoom_scale * 100)}%")
-        self.redraw_tree()
+        self._rescale_canvas(old_scale)
 
     def _zoom_out(self):
         """Zoom out the tree visualization."""
+        old_scale = self.zoom_scale
         self.zoom_scale = max(0.5, self.zoom_scale / 1.2)
         self.zoom_label.configure(text=f"{int(self.zoom_scale * 100)}%")
-        self.redraw_tree()
+        self._rescale_canvas(old_scale)
 
     def _zoom_reset(self):
         """Reset zoom to 100%."""
+        old_scale = self.zoom_scale
         self.zoom_scale = 1.0
         self.zoom_label.configure(text="100%")
-        self.redraw_tree()
+        self._rescale_canvas(old_scale)
+
+    def _rescale_canvas(self, old_scale):
+        """
+        Apply a zoom change to the items already on the canvas.
+        
+        The layout is linear in the zoom factor around the root position, so
+        the drawing is scaled in place by Tk instead of being rebuilt.
+        
+        Args:
+            old_scale (float): The zoom factor the canvas was drawn with
+        """
+        if not self.tree.root or self.zoom_scale == old_scale:
+            return
+            
+        ratio = self.zoom_scale / old_scale
+        origin_x, origin_y = self.zoom_origin
+        self.canvas.scale("all", origin_x, origin_y, ratio, ratio)
+        
+        # Tk scales coordinates only, so refresh the zoom-dependent line styles
+        self.canvas.itemconfigure("edge", **self._edge_style())
 
     def _update_status(self, message, status_type="info"):
         """
@@ -896,9 +1302,7 @@ For more advanced algorithms, see CSC6023 course materials.
         """
         try:
             # Close any existing explanation window when new input is entered
-            if self.current_explanation_window and self.current_explanation_window.winfo_exists():
-                self.current_explanation_window.destroy()
-                self.current_explanation_window = None
+            self._hide_explanation()
             
             user_input = self.entry.get().strip()
             
@@ -907,6 +1311,13 @@ For more advanced algorithms, see CSC6023 course materials.
                 self._update_status("Please enter a number", "warning")
                 return
                 
+            # An optional sign followed by decimal digits, which int() also
+            # accepts with single underscores between them (as in 1_000)
+            digits = user_input[1:] if user_input[0] in "+-" else user_input
+            if (not digits.replace("_", "").isdecimal() or "__" in digits
+                    or digits[0] == "_" or digits[-1] == "_"):
+                self._update_status(f"'{user_input}' is not a valid integer", "error")
+                return
             num = int(user_input)
             
             if num <= 0:
@@ -917,114 +1328,89 @@ For more advanced algorithms, see CSC6023 course materials.
             # Reset operation tracking
             self.operation_log = []
             
-            # Determine operation based on existence
-            if self.tree.contains(num):
-                # Track deletion process
-                self._track_deletion(num)
-                self.tree.delete(num)
-                operation = "deleted"
-                self._update_status(f"Successfully deleted {num} from the tree", "success")
-                self._show_operation_explanation(num, "delete")
-            else:
-                # Track insertion process
-                self._track_insertion(num)
-                self.tree.insert(num)
-                operation = "inserted"
+            # Insert or delete based on existence, in a single tree descent
+            action, result = self.tree.toggle(num)
+            if action == "inserted":
                 self._update_status(f"Successfully inserted {num} into the tree", "success")
-                self._show_operation_explanation(num, "insert")
+                if self.explanations_enabled:
+                    self._track_insertion(num, result)
+                    self._show_operation_explanation(num, "insert")
+            else:
+                path, case, replacement = result
+                self._update_status(f"Successfully deleted {num} from the tree", "success")
+                if self.explanations_enabled:
+                    self._track_deletion(num, path, case, replacement)
+                    self._show_operation_explanation(num, "delete")
             
             # Update visualization and clear input
-            self.redraw_tree()
+            self._schedule_redraw()
             self.entry.delete(0, ctk.END)
             
-        except ValueError:
-            self._update_status(f"'{user_input}' is not a valid integer", "error")
         except Exception as e:
             self._update_status(f"An error occurred: {str(e)}", "error")
 
-    def _track_insertion(self, value):
+    def _track_insertion(self, value, path):
         """
-        Track the insertion process to explain what happens step by step.
+        Explain the insertion process step by step.
         
         Args:
-            value (int): The value being inserted
+            value (int): The value that was inserted
+            path (list): The descent reported by AVLTree.insert, as
+                         (value, went_left) pairs from the root downward
         """
         self.operation_log = []
         
-        if not self.tree.root:
+        if not path:
             self.operation_log.append(f"🌳 Tree is empty, so {value} becomes the root node.")
             return
         
-        # Track the path from root to insertion point
-        current = self.tree.root
-        path = []
-        
-        while current:
-            path.append(current.data)
-            if value < current.data:
-                self.operation_log.append(f"📍 {value} < {current.data}, so we go LEFT from {current.data}")
-                if not current.left:
-                    self.operation_log.append(f"✅ Found empty left position under {current.data}, placing {value} here.")
-                    break
-                current = current.left
-            elif value > current.data:
-                self.operation_log.append(f"📍 {value} > {current.data}, so we go RIGHT from {current.data}")
-                if not current.right:
-                    self.operation_log.append(f"✅ Found empty right position under {current.data}, placing {value} here.")
-                    break
-                current = current.right
+        # Follow the path from root to insertion point
+        for key, went_left in path:
+            if went_left:
+                self.operation_log.append(f"📍 {value} < {key}, so we go LEFT from {key}")
             else:
-                self.operation_log.append(f"⚠️ {value} already exists in the tree, no insertion needed.")
-                return
-        
+                self.operation_log.append(f"📍 {value} > {key}, so we go RIGHT from {key}")
+                
+        key, went_left = path[-1]
+        side = "left" if went_left else "right"
+        self.operation_log.append(f"✅ Found empty {side} position under {key}, placing {value} here.")
         self.operation_log.append(f"🔄 After insertion, the tree will check if rebalancing is needed...")
         self.operation_log.append(f"⚖️ AVL property: height difference between left/right subtrees must be ≤ 1")
 
-    def _track_deletion(self, value):
+    def _track_deletion(self, value, path, case, replacement):
         """
-        Track the deletion process to explain what happens step by step.
+        Explain the deletion process step by step.
         
         Args:
-            value (int): The value being deleted
+            value (int): The value that was deleted
+            path (list): The descent reported by AVLTree.delete, as
+                         (value, went_left) pairs from the root downward
+            case (int): 1 for a leaf, 2 for one child, 3 for two children
+            replacement (int): The child or inorder successor that took the
+                               deleted value's place (None for a leaf)
         """
         self.operation_log = []
         
-        # Find the node to be deleted
-        current = self.tree.root
-        parent = None
-        
-        # Track path to the node
-        while current and current.data != value:
-            parent = current
-            if value < current.data:
-                self.operation_log.append(f"🔍 Looking for {value}: {value} < {current.data}, go LEFT")
-                current = current.left
+        # Follow the path to the node
+        for key, went_left in path:
+            if went_left:
+                self.operation_log.append(f"🔍 Looking for {value}: {value} < {key}, go LEFT")
             else:
-                self.operation_log.append(f"🔍 Looking for {value}: {value} > {current.data}, go RIGHT")
-                current = current.right
-        
-        if not current:
-            self.operation_log.append(f"❌ {value} not found in tree!")
-            return
+                self.operation_log.append(f"🔍 Looking for {value}: {value} > {key}, go RIGHT")
         
         self.operation_log.append(f"✅ Found {value} in the tree!")
         
         # Analyze deletion case
-        if not current.left and not current.right:
+        if case == 1:
             self.operation_log.append(f"📝 Case 1: {value} is a LEAF node (no children)")
             self.operation_log.append(f"🗑️ Simply remove {value} from the tree")
-        elif not current.left or not current.right:
-            child = current.left if current.left else current.right
-            self.operation_log.append(f"📝 Case 2: {value} has ONE child ({child.data})")
-            self.operation_log.append(f"🔄 Replace {value} with its child {child.data}")
+        elif case == 2:
+            self.operation_log.append(f"📝 Case 2: {value} has ONE child ({replacement})")
+            self.operation_log.append(f"🔄 Replace {value} with its child {replacement}")
         else:
-            # Find successor
-            successor = current.right
-            while successor.left:
-                successor = successor.left
             self.operation_log.append(f"📝 Case 3: {value} has TWO children")
-            self.operation_log.append(f"🔄 Find inorder successor (smallest in right subtree): {successor.data}")
-            self.operation_log.append(f"📋 Replace {value} with {successor.data}, then delete the successor")
+            self.operation_log.append(f"🔄 Find inorder successor (smallest in right subtree): {replacement}")
+            self.operation_log.append(f"📋 Replace {value} with {replacement}, then delete the successor")
         
         self.operation_log.append(f"⚖️ After deletion, check AVL balance and rebalance if needed...")
 
@@ -1032,248 +1418,333 @@ For more advanced algorithms, see CSC6023 course materials.
         """
         Show a popup explaining what happened during the insert/delete operation.
         
+        The popup window is created on first use and hidden rather than
+        destroyed when closed, so later operations only update its text.
+        
         Args:
             value (int): The value that was inserted or deleted
             operation_type (str): Either "insert" or "delete"
         """
-        # Create explanation window
-        explanation_window = ctk.CTkToplevel(self)
+        if self._expl_window is None or not self._expl_window.winfo_exists():
+            self._create_explanation_window()
+        explanation_window = self._expl_window
         explanation_window.title(f"AVL Tree Operation: {operation_type.title()} {value}")
-        explanation_window.geometry("400x400")
-        explanation_window.resizable(True, True)
         
-        # Store reference to current window
-        self.current_explanation_window = explanation_window
+        # Title
+        self._expl_title.configure(text=f"🔄 {operation_type.title()}ing {value} from AVL Tree")
         
-        # Make it appear on top but not modal
-        explanation_window.transient(self)
-        explanation_window.lift()
-        explanation_window.focus_set()
+        # Operation explanation
+        explanation_text = "\n".join(self.operation_log)
+        
+        # Add general AVL info
+        additional_info = _INSERT_INFO if operation_type == "insert" else _DELETE_INFO
+        
+        self._expl_text.configure(text=explanation_text + additional_info)
+        
+        # Add current tree info, kept up to date by the tree itself
+        tree_height = self.tree.root.height if self.tree.root else 0
+        node_count = len(self.tree)
+        
+        # Minimum possible height, and the 1.44*log2(n) AVL height bound
+        if node_count > 0:
+            log_count = math.log2(node_count + 1)
+            min_height = max(1, int(log_count))
+            height_limit = max(1, int(1.44 * log_count))
+        else:
+            min_height = 0
+            height_limit = 1
+        well_balanced = tree_height <= height_limit or node_count <= 1
+        
+        tree_stats = f"""
+📊 Current Tree Statistics:
+• Total Nodes: {node_count}
+• Tree Height: {tree_height}
+• Theoretical Minimum Height: {min_height}
+• Well Balanced: {'✅ Yes' if well_balanced else '❌ No'}
+"""
+        
+        self._expl_stats.configure(text=tree_stats)
+        
+        # Start reading from the top, even if the last explanation was scrolled
+        # (CTkScrollableFrame has no public scrolling method)
+        self._expl_frame._parent_canvas.yview_moveto(0)
         
         # Center the window
-        explanation_window.update_idletasks()
         x = (explanation_window.winfo_screenwidth()) - (400 // 2)
         y = (explanation_window.winfo_screenheight() // 2) - (400 // 2)
         explanation_window.geometry(f"400x400+{x}+{y}")
         
-        # Handle window closing
-        def on_close():
-            self.current_explanation_window = None
-            explanation_window.destroy()
+        # Make it appear on top but not modal
+        explanation_window.deiconify()
+        explanation_window.lift()
+        explanation_window.focus_set()
+
+    def _create_explanation_window(self):
+        """
+        Build the explanation popup and its labels, initially hidden.
+        
+        The labels are kept on the visualizer so that
+        _show_operation_explanation can fill them in for each operation.
+        """
+        explanation_window = ctk.CTkToplevel(self)
+        explanation_window.geometry("400x400")
+        explanation_window.resizable(True, True)
+        explanation_window.transient(self)
+        explanation_window.withdraw()
         
-        explanation_window.protocol("WM_DELETE_WINDOW", on_close)
+        # Closing the window only hides it so it can be shown again
+        explanation_window.protocol("WM_DELETE_WINDOW", self._hide_explanation)
         
         # Create scrollable frame
         scrollable_frame = ctk.CTkScrollableFrame(explanation_window)
         scrollable_frame.pack(fill="both", expand=True, padx=15, pady=15)
+        self._expl_frame = scrollable_frame
         
         # Title
-        title_text = f"🔄 {operation_type.title()}ing {value} from AVL Tree"
-        title = ctk.CTkLabel(
+        self._expl_title = ctk.CTkLabel(
             scrollable_frame, 
-            text=title_text, 
+            text="", 
             font=ctk.CTkFont(size=16, weight="bold")
         )
-        title.pack(pady=(0, 15))
+        self._expl_title.pack(pady=(0, 15))
         
         # Operation explanation
-        explanation_text = "\n".join(self.operation_log)
-        
-        # Add general AVL info
-        if operation_type == "insert":
-            additional_info = f"""
-
-🎯 Why This Placement?
-In a Binary Search Tree (BST), we follow a simple rule:
-• If new value < current node → go LEFT
-• If new value > current node → go RIGHT
-• Place the new node when we find an empty spot
-
-⚖️ AVL Balancing:
-After insertion, the tree checks each node's balance factor:
-• Balance Factor = Height(Left) - Height(Right)
-• If any node has |Balance Factor| > 1, rotations are performed
-• This keeps the tree height around log₂(n) for optimal performance
-
-🔄 Possible Rotations:
-• Left Rotation: When right side gets too heavy
-• Right Rotation: When left side gets too heavy
-• Left-Right: Complex case needing two rotations
-• Right-Left: Complex case needing two rotations
-"""
-        else:  # delete
-            additional_info = f"""
-
-🗑️ Deletion Strategy:
-AVL deletion follows BST rules with three cases:
-1. Leaf node: Just remove it
-2. One child: Replace node with its child
-3. Two children: Replace with inorder successor
-
-🔄 Why Inorder Successor?
-The inorder successor is the smallest value in the right subtree.
-It's guaranteed to be larger than all left subtree values and smaller
-than all other right subtree values, maintaining BST property.
-
-⚖️ Rebalancing After Deletion:
-After removing a node, the tree might become unbalanced.
-The same rotation rules apply to restore the AVL property.
-"""
-        
-        full_explanation = explanation_text + additional_info
-        
-        explanation_label = ctk.CTkLabel(
+        self._expl_text = ctk.CTkLabel(
             scrollable_frame, 
-            text=full_explanation, 
+            text="", 
             font=ctk.CTkFont(size=11),
             justify="left",
             wraplength=460
         )
-        explanation_label.pack(pady=(0, 15))
-        
-        # Add current tree info
-        levels = self.tree.get_nodes_by_level()
-        tree_height = len(levels) if levels else 0
-        node_count = sum(len(level) for level in levels) if levels else 0
-        
-        tree_stats = f"""
-📊 Current Tree Statistics:
-• Total Nodes: {node_count}
-• Tree Height: {tree_height}
-• Theoretical Minimum Height: {max(1, int(__import__('math').log2(node_count + 1))) if node_count > 0 else 0}
-• Well Balanced: {'✅ Yes' if tree_height <= max(1, int(1.44 * __import__('math').log2(node_count + 1))) or node_count <= 1 else '❌ No'}
-"""
+        self._expl_text.pack(pady=(0, 15))
         
-        stats_label = ctk.CTkLabel(
+        # Current tree info
+        self._expl_stats = ctk.CTkLabel(
             scrollable_frame, 
-            text=tree_stats, 
+            text="", 
             font=ctk.CTkFont(size=11),
             justify="left"
         )
-        stats_label.pack(pady=(10, 15))
+        self._expl_stats.pack(pady=(10, 15))
         
         # Close button
         close_button = ctk.CTkButton(
             explanation_window,
             text="Got It! Continue →",
-            command=on_close,
+            command=self._hide_explanation,
             width=150,
             height=35
         )
         close_button.pack(pady=15)
+        
+        self._expl_window = explanation_window
 
-    def redraw_tree(self):
+    def _hide_explanation(self):
+        """Hide the explanation popup if it is currently shown."""
+        if (self._expl_window is not None and self._expl_window.winfo_exists()
+                and self._expl_window.winfo_viewable()):
+            self._expl_window.withdraw()
+
+    def _schedule_redraw(self):
         """
-        Redraw the entire tree visualization on the canvas.
+        Queue a redraw of the tree for when Tk is next idle.
         
-        This method clears the canvas and draws the current state of the tree,
-        including all nodes and connections. It calculates positions for nodes
-        respecting parent-child relationships.
+        Operations that arrive back to back share a single redraw, so a burst
+        of input only pays for drawing the final tree.
         """
-        self.canvas.delete("all")
+        if not self._redraw_pending:
+            self._redraw_pending = True
+            self.after_idle(self._do_redraw)
+
+    def _do_redraw(self):
+        """Run a redraw queued by _schedule_redraw."""
+        self._redraw_pending = False
+        self.redraw_tree()
+
+    def redraw_tree(self):
+        """
+        Bring the tree visualization on the canvas up to date.
         
+        Canvas items are kept between calls and tracked per node, so only the
+        nodes that appeared, disappeared, moved or changed value are touched.
+        Node positions come from the layout computed by the tree and respect
+        parent-child relationships.
+        """
         if not self.tree.root:
+            self.canvas.delete("all")
+            self._drawn = {}
+            
             # Draw empty tree message
-            canvas_width = self.canvas.winfo_width() or 850
-            canvas_height = self.canvas.winfo_height() or 450
+            canvas_width = self._cw or 850
+            canvas_height = self._ch or 450
             self.canvas.create_text(
                 canvas_width//2 + 150, canvas_height//2 + 50,
                 text="Tree is empty\nEnter a positive integer to start",
                 fill="white", 
-                font=("Arial", 16),
+                font=self._empty_font,
                 anchor="center",
-                justify="center"
+                justify="center",
+                tags=("empty",)
             )
             return
 
-        canvas_width = self.canvas.winfo_width() or 850
-        canvas_height = self.canvas.winfo_height() or 450
+        canvas_width = self._cw or 850
         
-        # Calculate positions using proper tree structure
-        positions = {}
-        self._calculate_positions(self.tree.root, canvas_width//2, 50, canvas_width//6, positions)
-
-        # Draw connections first (so they appear behind nodes)
-        for node, (x1, y1) in positions.items():
-            # Calculate scaled radius based on zoom
-            node_radius = int(20 * self.zoom_scale)
-            line_width = max(1, int(2 * self.zoom_scale))  # Scale line width too
+        root_x, root_y = canvas_width//2, 50
+        if self.zoom_origin != (root_x, root_y):
+            # The canvas size changed, so every item has to be placed again
+            self.canvas.delete("all")
+            self._drawn = {}
+            self.zoom_origin = (root_x, root_y)
+        else:
+            self.canvas.delete("empty")
             
-            # Helper function to draw arrow from parent to child
-            def draw_arrow_to_child(child_node):
-                if child_node and child_node in positions:
-                    x2, y2 = positions[child_node]
+        # Map the tree's layout positions onto the canvas
+        x_scale = canvas_width * self.zoom_scale
+        y_scale = 60 * self.zoom_scale
+        
+        # Calculate scaled radius based on zoom
+        node_radius = 20 * self.zoom_scale
+        
+        # Items are created with coordinates and tags only, plus a transient
+        # "new" tag; only those items are styled once the canvas is up to date
+        restyle = False
+        drawn = {}
+        # Layout x of each node's parent, in level order. Levels list the
+        # children of the level above from left to right, so the next
+        # level's parents line up with the nodes as they are collected
+        parent_xs = [None]
+        for depth, level in enumerate(self.tree.get_nodes_by_level()):
+            # Every node on a level shares the same canvas y
+            y = root_y + depth * y_scale
+            child_parent_xs = []
+            for node, parent_x in zip(level, parent_xs):
+                if node.left:
+                    child_parent_xs.append(node.x)
+                if node.right:
+                    child_parent_xs.append(node.x)
                     
-                    # Calculate angle between parent and child
-                    dx = x2 - x1
-                    dy = y2 - y1
-                    angle = math.atan2(dy, dx)
+                # Layout positions are zoom independent, because zooming
+                # rescales the existing items in place
+                is_root = node is self.tree.root
+                state = (node.x, node.y, parent_x, node.data, is_root)
+                items = self._drawn.pop(node, None)
+                if items is not None and items[3] == state:
+                    drawn[node] = items
+                    continue
                     
-                    # Calculate arrow start point (edge of parent node)
-                    start_x = x1 + node_radius * math.cos(angle)
-                    start_y = y1 + node_radius * math.sin(angle)
+                x = root_x + node.x * x_scale
+                edge = None
+                if parent_x is not None:
+                    edge = self._edge_coords(root_x + parent_x * x_scale,
+                                             y - y_scale, x, y, node_radius)
                     
-                    # Calculate arrow end point (edge of child node)
-                    end_x = x2 - node_radius * math.cos(angle)
-                    end_y = y2 - node_radius * math.sin(angle)
+                if items is not None:
+                    # Update the existing items in place
+                    oval_id, text_id, line_id, old_state = items
+                    self.canvas.coords(oval_id, x - node_radius, y - node_radius,
+                                       x + node_radius, y + node_radius)
+                    self.canvas.coords(text_id, x, y)
+                    if old_state[3] != node.data:
+                        self.canvas.itemconfigure(text_id, text=str(node.data))
+                    if old_state[4] != is_root:
+                        self.canvas.itemconfigure(
+                            oval_id, tags=("root" if is_root else "node", "new"))
+                        restyle = True
+                    if edge is None:
+                        if line_id:
+                            self.canvas.delete(line_id)
+                            line_id = None
+                    elif line_id:
+                        self.canvas.coords(line_id, *edge)
+                    else:
+                        line_id = self.canvas.create_line(*edge, tags=("edge", "new"))
+                        restyle = True
+                    drawn[node] = (oval_id, text_id, line_id, state)
+                    continue
                     
-                    # Draw the arrow line
-                    self.canvas.create_line(
-                        start_x, start_y, end_x, end_y, 
-                        fill="#ED6942", 
-                        width=line_width, 
-                        arrow=tk.LAST,
-                        arrowshape=(10 * self.zoom_scale, 12 * self.zoom_scale, 5 * self.zoom_scale)
-                    )
-            
-            # Draw arrows to both children
-            draw_arrow_to_child(node.left)
-            draw_arrow_to_child(node.right)
-
-        # Draw nodes
-        for node, (x, y) in positions.items():
-            radius = int(20 * self.zoom_scale)  # Scale node radius
-            color = "#0a77ca" if node == self.tree.root else "#79baec"
-            
-            # Draw node circle
-            self.canvas.create_oval(
-                x - radius, y - radius, x + radius, y + radius, 
-                fill=color, outline="#2c2c2c", width=2
-            )
+                # Draw the arrow from the parent
+                line_id = None
+                if edge is not None:
+                    line_id = self.canvas.create_line(*edge, tags=("edge", "new"))
+                    
+                # Draw node circle
+                oval_id = self.canvas.create_oval(
+                    x - node_radius, y - node_radius, x + node_radius, y + node_radius, 
+                    tags=("root" if is_root else "node", "new")
+                )
+                
+                # Draw node value
+                text_id = self.canvas.create_text(
+                    x, y, text=str(node.data), tags=("label", "new")
+                )
+                drawn[node] = (oval_id, text_id, line_id, state)
+                restyle = True
+            parent_xs = child_parent_xs
+
+        # Remove the items of nodes that left the tree
+        for oval_id, text_id, line_id, _ in self._drawn.values():
+            self.canvas.delete(oval_id, text_id)
+            if line_id:
+                self.canvas.delete(line_id)
+        self._drawn = drawn
+        
+        if restyle:
+            self._style_items("new")
+            self.canvas.dtag("new", "new")
             
-            # Draw node value
-            self.canvas.create_text(
-                x, y, text=str(node.data), 
-                fill="white", font=("Arial", 12, "bold")
-            )
+        # Keep connections behind the nodes
+        self.canvas.tag_lower("edge")
 
-    def _calculate_positions(self, node, x, y, x_offset, positions):
+    def _style_items(self, tag):
         """
-        Recursively calculate node positions based on tree structure.
+        Apply the drawing style to the tree's canvas items that carry a tag.
+        
+        Edges are tagged "edge", node circles "node" or "root" and node
+        values "label", so one call per kind styles every matching item.
         
         Args:
-            node: Current node being positioned
-            x: X coordinate for this node
-            y: Y coordinate for this node  
-            x_offset: Horizontal spacing for children
-            positions: Dictionary to store calculated positions
+            tag (str): Only items that also carry this tag are styled
         """
-        if not node:
-            return
-            
-        # Apply zoom scale
-        scaled_y_offset = 60 * self.zoom_scale  # Changed from 80 to 60
-        scaled_x_offset = x_offset * self.zoom_scale
-        
-        positions[node] = (x, y)
+        self.canvas.itemconfigure(f"edge&&{tag}", fill="#ED6942", arrow=tk.LAST,
+                                  **self._edge_style())
+        self.canvas.itemconfigure(f"node&&{tag}", fill="#79baec", outline="#2c2c2c", width=2)
+        self.canvas.itemconfigure(f"root&&{tag}", fill="#0a77ca", outline="#2c2c2c", width=2)
+        self.canvas.itemconfigure(f"label&&{tag}", fill="white", font=self._node_font)
+
+    def _edge_style(self):
+        """
+        Return the zoom-dependent options of the arrows between nodes.
         
-        if node.left:
-            self._calculate_positions(node.left, x - scaled_x_offset, y + scaled_y_offset, 
-                                    scaled_x_offset * 0.6, positions)
+        Returns:
+            dict: Line width and arrow head shape for the current zoom
+        """
+        return {
+            "width": max(1, int(2 * self.zoom_scale)),  # Scale line width too
+            "arrowshape": (10 * self.zoom_scale, 12 * self.zoom_scale, 5 * self.zoom_scale),
+        }
+
+    def _edge_coords(self, x1, y1, x2, y2, radius):
+        """
+        Calculate where the arrow between a parent and a child starts and ends.
         
-        if node.right:
-            self._calculate_positions(node.right, x + scaled_x_offset, y + scaled_y_offset, 
-                                    scaled_x_offset * 0.6, positions)
+        Args:
+            x1, y1: Center of the parent node on the canvas
+            x2, y2: Center of the child node on the canvas
+            radius: Radius of the node circles
+            
+        Returns:
+            tuple: (start_x, start_y, end_x, end_y) on the edges of both circles
+        """
+        # Offset of length radius along the line from parent to child
+        dx = x2 - x1
+        dy = y2 - y1
+        scale = radius / math.hypot(dx, dy)
+        dx *= scale
+        dy *= scale
+        
+        # The arrow starts at the edge of the parent and ends at the edge of the child
+        return (x1 + dx, y1 + dy, x2 - dx, y2 - dy)
 
 def main():
     """